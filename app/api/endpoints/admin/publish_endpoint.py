@@ -22,6 +22,9 @@ from app.pages.admin_publish import render_publish_management_page
 
 logger = get_logger()
 
+# 上传文件落盘时的分块大小
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def _get_publish_queue():
     """获取全局发布队列实例（延迟导入避免循环依赖）"""
@@ -44,10 +47,10 @@ async def _save_uploaded_files(files: List, upload_dir: str = None) -> List[str]
             unique_filename = f"{uuid.uuid4()}{file_ext}"
             file_path = os.path.join(upload_dir, unique_filename)
             
-            # 保存文件
+            # 分块写入，避免整个文件一次性读入内存
             with open(file_path, 'wb') as f:
-                content = await file.read()
-                f.write(content)
+                while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+                    f.write(chunk)
             
             saved_paths.append(file_path)
             logger.info(f"保存上传文件: {file_path}")
@@ -49,6 +49,7 @@ def _server_error(message: str) -> Dict[str, Any]:
     tags={"bilibili", "search"}
 )
 async def search(keywords: str, page_size: int = 5, page_num: int = 1):
+    crawler = None
     try:
         # 直接实例化Crawler调用方法
         crawler = bilibili_core.BilibiliCrawler(headless=global_settings.browser.headless, enable_save_media=False)
@@ -60,8 +61,6 @@ async def search(keywords: str, page_size: int = 5, page_num: int = 1):
             page_num=page_num,
         )
 
-        await crawler.cleanup()
-
         return {
             "code": error_codes.SUCCESS[0],
             "msg": error_codes.SUCCESS[1],
@@ -76,6 +75,10 @@ async def search(keywords: str, page_size: int = 5, page_num: int = 1):
     except Exception as exc:  # pragma: no cover - runtime safeguard
         logger.error(f"[Bilibili.search] failed: {exc}")
         return _server_error(f"bilibili 搜索失败: {exc}")
+    finally:
+        # 无论成功或异常都释放 crawler 持有的 API 客户端
+        if crawler:
+            await crawler.cleanup()
 
 
 @bili_mcp.tool(
@@ -91,6 +94,7 @@ async def crawler_detail(video_ids: list[str]):
     except ValidationError as exc:
         return _validation_error(exc)
 
+    crawler = None
     try:
         # 直接实例化Crawler调用方法
         crawler = bilibili_core.BilibiliCrawler(headless=global_settings.browser.headless, enable_save_media=False)
@@ -101,8 +105,6 @@ async def crawler_detail(video_ids: list[str]):
             source_keyword="detail"
         )
 
-        await crawler.cleanup()
-
         return {
             "code": error_codes.SUCCESS[0],
             "msg": error_codes.SUCCESS[1],
@@ -118,6 +120,10 @@ async def crawler_detail(video_ids: list[str]):
         import traceback
         logger.error(f"[Bilibili.detail] failed: {traceback.format_exc()}")
         return _server_error(f"bilibili 详情获取失败: {exc}, 可以重试一下")
+    finally:
+        # 无论成功或异常都释放 crawler 持有的 API 客户端
+        if crawler:
+            await crawler.cleanup()
 
 
 @bili_mcp.tool(
@@ -135,6 +141,7 @@ async def crawler_creator(creator_id: str, page_num: int = 1, page_size: int = 3
     except ValidationError as exc:
         return _validation_error(exc)
 
+    crawler = None
     try:
         # 直接实例化Crawler调用方法
         crawler = bilibili_core.BilibiliCrawler(headless=global_settings.browser.headless, enable_save_media=False)
@@ -146,8 +153,6 @@ async def crawler_creator(creator_id: str, page_num: int = 1, page_size: int = 3
             page_size=req.page_size
         )
 
-        await crawler.cleanup()
-
         return {
             "code": error_codes.SUCCESS[0],
             "msg": error_codes.SUCCESS[1],
@@ -162,6 +167,10 @@ async def crawler_creator(creator_id: str, page_num: int = 1, page_size: int = 3
     except Exception as exc:  # pragma: no cover
         logger.error(f"[Bilibili.creator] failed: {exc}")
         return _server_error(f"bilibili 创作者抓取失败: {exc}")
+    finally:
+        # 无论成功或异常都释放 crawler 持有的 API 客户端
+        if crawler:
+            await crawler.cleanup()
 
 
 @bili_mcp.tool(
@@ -181,6 +190,7 @@ async def search_time_range_http(keywords: str, start_day: str, end_day: str, pa
     except ValidationError as exc:
         return _validation_error(exc)
 
+    crawler = None
     try:
         # 直接实例化Crawler调用方法
         crawler = bilibili_core.BilibiliCrawler(headless=global_settings.browser.headless, enable_save_media=False)
@@ -194,8 +204,6 @@ async def search_time_range_http(keywords: str, start_day: str, end_day: str, pa
             page_num=req.page_num
         )
 
-        await crawler.cleanup()
-
         return {
             "code": error_codes.SUCCESS[0],
             "msg": error_codes.SUCCESS[1],
@@ -211,6 +219,10 @@ async def search_time_range_http(keywords: str, start_day: str, end_day: str, pa
         import traceback
         logger.error(f"[Bilibili.search_time_range] failed: {traceback.format_exc()}")
         return _server_error(f"bilibili 时间范围搜索失败: {exc}")
+    finally:
+        # 无论成功或异常都释放 crawler 持有的 API 客户端
+        if crawler:
+            await crawler.cleanup()
 
 
 @bili_mcp.tool(
@@ -228,6 +240,7 @@ async def crawler_comments(video_ids: list[str], max_comments: int = 20, fetch_s
     except ValidationError as exc:
         return _validation_error(exc)
 
+    crawler = None
     try:
         # 直接实例化Crawler调用方法
         crawler = bilibili_core.BilibiliCrawler(headless=global_settings.browser.headless, enable_save_media=False)
@@ -239,8 +252,6 @@ async def crawler_comments(video_ids: list[str], max_comments: int = 20, fetch_s
             max_comments_per_note=req.max_comments
         )
 
-        await crawler.cleanup()
-
         return {
             "code": error_codes.SUCCESS[0],
             "msg": error_codes.SUCCESS[1],
@@ -255,6 +266,10 @@ async def crawler_comments(video_ids: list[str], max_comments: int = 20, fetch_s
     except Exception as exc:  # pragma: no cover
         logger.error(f"[Bilibili.comments] failed: {exc}")
         return _server_error(f"bilibili 评论抓取失败: {exc}")
+    finally:
+        # 无论成功或异常都释放 crawler 持有的 API 客户端
+        if crawler:
+            await crawler.cleanup()
 
 
 __all__ = ["bili_mcp"]
\ No newline at end of file
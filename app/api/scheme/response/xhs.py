@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
@@ -277,21 +278,18 @@ class XhsSearchResult(BaseModel):
         # 内容类型分布
         type_counts = {}
         trending_counts = {}
+        tag_counts = Counter()
         total_engagement = 0
         
+        # 单次遍历同时统计类型、热度、互动与标签
         for note in self.notes:
             type_counts[note.note_type] = type_counts.get(note.note_type, 0) + 1
             trending_counts[note.trending_level] = trending_counts.get(note.trending_level, 0) + 1
             total_engagement += note.engagement.total_engagement
+            tag_counts.update(note.tags)
         
         # 热门标签
-        all_tags = []
-        for note in self.notes:
-            all_tags.extend(note.tags)
-        tag_counts = {}
-        for tag in all_tags:
-            tag_counts[tag] = tag_counts.get(tag, 0) + 1
-        top_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+        top_tags = tag_counts.most_common(5)
         
         analysis = {
             "content_types": type_counts,
@@ -299,33 +297,38 @@ class XhsSearchResult(BaseModel):
             "avg_engagement": total_engagement // len(self.notes),
             "top_tags": [tag for tag, count in top_tags],
             "total_notes": len(self.notes),
-            "insights": self._generate_insights()
+            "insights": self._generate_insights(type_counts, trending_counts, total_engagement)
         }
         
         self.analysis = analysis
         return analysis
     
-    def _generate_insights(self) -> List[str]:
-        """生成洞察"""
+    def _generate_insights(
+        self,
+        type_counts: Dict[str, int],
+        trending_counts: Dict[str, int],
+        total_engagement: int,
+    ) -> List[str]:
+        """根据 analyze_data 已统计的计数生成洞察，避免再次遍历笔记"""
         if not self.notes:
             return ["无数据"]
         
         insights = []
         
         # 爆款内容比例
-        viral_count = sum(1 for note in self.notes if note.trending_level == "viral")
+        viral_count = trending_counts.get("viral", 0)
         if viral_count > len(self.notes) * 0.3:
             insights.append("包含较多爆款内容")
         
         # 视频内容比例
-        video_count = sum(1 for note in self.notes if note.note_type == "video")
+        video_count = type_counts.get("video", 0)
         if video_count > len(self.notes) * 0.6:
             insights.append("视频内容占主导")
         else:
             insights.append("图文内容为主")
         
         # 互动活跃度
-        avg_engagement = sum(note.engagement.total_engagement for note in self.notes) / len(self.notes)
+        avg_engagement = total_engagement / len(self.notes)
         if avg_engagement > 5000:
             insights.append("整体互动活跃")
         elif avg_engagement < 500:
@@ -351,8 +354,11 @@ class XhsCommentsResult(BaseModel):
         
         for comment in self.comments:
             sentiment_counts[comment.sentiment] += 1
-            if comment.like_count_int > 10:
-                hot_comments.append(comment)
+            # like_count_int 每次访问都要解析字符串，这里每条评论只算一次
+            like_count = comment.like_count_int
+            if like_count > 10:
+                hot_comments.append((like_count, comment))
         
         self.sentiment_stats = sentiment_counts
-        self.hot_comments = sorted(hot_comments, key=lambda x: x.like_count_int, reverse=True)[:10]
+        hot_comments.sort(key=lambda x: x[0], reverse=True)
+        self.hot_comments = [comment for _, comment in hot_comments[:10]]
@@ -562,11 +562,14 @@ async def get_pool_manager() -> BrowserPoolManager:
     """获取全局浏览器池管理器实例"""
     global _pool_manager
 
+    # 快路径无锁；仅首次创建时加锁，且初始化完成后才发布实例，
+    # 避免并发调用方拿到尚未 initialize 的管理器
     if _pool_manager is None:
         async with _manager_lock:
             if _pool_manager is None:
-                _pool_manager = BrowserPoolManager()
-                await _pool_manager.initialize()
+                manager = BrowserPoolManager()
+                await manager.initialize()
+                _pool_manager = manager
 
     return _pool_manager
 
@@ -10,6 +10,7 @@ from playwright.async_api import BrowserContext, Page
 # 移除对全局 config、base、tools 的依赖
 # from base.base_crawler import AbstractApiClient  # 不需要继承
 # from tools import utils  # 直接使用 logging
+from app.core.crawler.tools.crawler_util import new_async_client
 from app.providers.logger import get_logger
 
 logger = get_logger()
@@ -18,6 +19,9 @@ from .exception import DataFetchError
 from .field import CommentOrderType, SearchOrderType
 from .help import BilibiliSign
 
+# 建连失败（ConnectError/ConnectTimeout）时的传输层重试次数
+_CONNECT_RETRIES = 2
+
 
 class BilibiliClient:
 
@@ -36,6 +40,8 @@ class BilibiliClient:
         self._host = "https://api.bilibili.com"
         self.playwright_page = playwright_page
         self.cookie_dict = cookie_dict
+        # 懒加载的共享 httpx 客户端，复用连接池避免每次请求重新握手
+        self._http_client: Optional[httpx.AsyncClient] = None
 
     def _with_default_headers(self, headers: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Merge caller headers with browser-like defaults."""
@@ -73,15 +79,33 @@ class BilibiliClient:
             normalized[key] = str(value)
         return normalized
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        if self._http_client is None or self._http_client.is_closed:
+            # 传输层对建连失败自动重试，复用同一连接池
+            self._http_client = new_async_client(proxy=self.proxy, retries=_CONNECT_RETRIES)
+        return self._http_client
+
+    async def close(self) -> None:
+        """关闭共享的 httpx 客户端"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def __aenter__(self) -> "BilibiliClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
     async def request(self, method, url, **kwargs) -> Any:
-        async with httpx.AsyncClient(proxy=self.proxy) as client:
-            response = await client.request(method, url, timeout=self.timeout, **kwargs)
-            logger.debug(f"[BilibiliClient.request] ----->url:{url} response:{response.json()}")
+        response = await self._get_http_client().request(method, url, timeout=self.timeout, **kwargs)
         try:
             data: Dict = response.json()
         except json.JSONDecodeError:
             logger.error(f"[BilibiliClient.request] Failed to decode JSON from response. status_code: {response.status_code}, response_text: {response.text}")
             raise DataFetchError(f"Failed to decode JSON, content: {response.text}")
+        # 使用 loguru 的延迟格式化，DEBUG 关闭时不序列化响应体
+        logger.debug("[BilibiliClient.request] ----->url:{} response:{}", url, data)
 
         if data.get("code") != 0:
             raise DataFetchError(data.get("message", "unkonw error"))
@@ -278,19 +302,20 @@ class BilibiliClient:
 
     async def get_video_media(self, url: str) -> Union[bytes, None]:
         # Follow CDN 302 redirects and treat any 2xx as success (some endpoints return 206)
-        async with httpx.AsyncClient(proxy=self.proxy, follow_redirects=True) as client:
-            try:
-                response = await client.request("GET", url, timeout=self.timeout, headers=self.headers)
-                response.raise_for_status()
-                if 200 <= response.status_code < 300:
-                    return response.content
-                logger.error(
-                    f"[BilibiliClient.get_video_media] Unexpected status {response.status_code} for {url}"
-                )
-                return None
-            except httpx.HTTPError as exc:  # some wrong when call httpx.request method, such as connection error, client error, server error or response status code is not 2xx
-                logger.error(f"[BilibiliClient.get_video_media] {exc.__class__.__name__} for {exc.request.url} - {exc}")  # 保留原始异常类型名称，以便开发者调试
-                return None
+        try:
+            response = await self._get_http_client().request(
+                "GET", url, timeout=self.timeout, headers=self.headers, follow_redirects=True
+            )
+            response.raise_for_status()
+            if 200 <= response.status_code < 300:
+                return response.content
+            logger.error(
+                f"[BilibiliClient.get_video_media] Unexpected status {response.status_code} for {url}"
+            )
+            return None
+        except httpx.HTTPError as exc:  # some wrong when call httpx.request method, such as connection error, client error, server error or response status code is not 2xx
+            logger.error(f"[BilibiliClient.get_video_media] {exc.__class__.__name__} for {exc.request.url} - {exc}")  # 保留原始异常类型名称，以便开发者调试
+            return None
 
     async def get_video_comments(
         self,
@@ -186,7 +186,13 @@ class BilibiliCrawler:
         """
         清理浏览器资源 - 现在不再真正关闭浏览器上下文，只清理引用
         浏览器实例由BrowserManager统一管理，实现复用
+        API 客户端的 httpx 连接池在此释放
         """
+        try:
+            if self.bili_client:
+                await self.bili_client.close()
+        except Exception as e:
+            logger.error(f"[BilibiliCrawler.cleanup] Error closing API client: {e}")
         try:
             # 不再释放浏览器上下文，保持常驻以实现复用
             # await browser_manager.release_context(self.platform_code, keep_alive=True)
@@ -473,8 +479,9 @@ class BilibiliCrawler:
         page_size = max(1, min(page_size, 50))
 
         keywords = keywords or ""
-        start_day = start_day or datetime.now().strftime("%Y-%m-%d")
-        end_day = end_day or datetime.now().strftime("%Y-%m-%d")
+        today = datetime.now().strftime("%Y-%m-%d")
+        start_day = start_day or today
+        end_day = end_day or today
 
         all_videos = []
         keywords_list = []
@@ -1330,6 +1337,11 @@ class BilibiliCrawler:
 
     async def close(self):
         """关闭浏览器上下文"""
+        try:
+            if self.bili_client:
+                await self.bili_client.close()
+        except Exception as e:
+            logger.error(f"[BilibiliCrawler.close] Error closing API client: {e}")
         try:
             if self.cdp_manager:
                 # CDP模式清理（暂未实现）
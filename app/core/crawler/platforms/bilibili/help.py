@@ -6,28 +6,30 @@ from app.providers.logger import get_logger
 
 logger = get_logger()
 
+# WBI 签名前需要从参数值中过滤掉的字符
+_WBI_FILTER_TABLE = str.maketrans("", "", "!'()*")
+
+# mixin key 重排表，所有实例共用
+_MIXIN_KEY_ENC_TAB = (
+    46, 47, 18, 2, 53, 8, 23, 32, 15, 50, 10, 31, 58, 3, 45, 35, 27, 43, 5, 49,
+    33, 9, 42, 19, 29, 28, 14, 39, 12, 38, 41, 13, 37, 48, 7, 16, 24, 55, 40,
+    61, 26, 17, 0, 1, 60, 51, 30, 4, 22, 25, 54, 21, 56, 59, 6, 63, 57, 62, 11,
+    36, 20, 34, 44, 52
+)
+
 
 class BilibiliSign:
     def __init__(self, img_key: str, sub_key: str):
         self.img_key = img_key
         self.sub_key = sub_key
-        self.map_table = [
-            46, 47, 18, 2, 53, 8, 23, 32, 15, 50, 10, 31, 58, 3, 45, 35, 27, 43, 5, 49,
-            33, 9, 42, 19, 29, 28, 14, 39, 12, 38, 41, 13, 37, 48, 7, 16, 24, 55, 40,
-            61, 26, 17, 0, 1, 60, 51, 30, 4, 22, 25, 54, 21, 56, 59, 6, 63, 57, 62, 11,
-            36, 20, 34, 44, 52
-        ]
 
     def get_salt(self) -> str:
         """
         获取加盐的 key
         :return:
         """
-        salt = ""
         mixin_key = self.img_key + self.sub_key
-        for mt in self.map_table:
-            salt += mixin_key[mt]
-        return salt[:32]
+        return "".join(mixin_key[mt] for mt in _MIXIN_KEY_ENC_TAB)[:32]
 
     def sign(self, req_data: Dict) -> Dict:
         """
@@ -41,7 +43,7 @@ class BilibiliSign:
         req_data = dict(sorted(req_data.items()))
         req_data = {
             # 过滤 value 中的 "!'()*" 字符
-            k: ''.join(filter(lambda ch: ch not in "!'()*", str(v)))
+            k: str(v).translate(_WBI_FILTER_TABLE)
             for k, v
             in req_data.items()
         }
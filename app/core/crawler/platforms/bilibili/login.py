@@ -172,6 +172,9 @@ class BilibiliLogin(AbstractLogin):
                 return via_page or cookie_present
             logger.debug(f"[BilibiliLogin.has_valid_cookie] Pong failed: {exc}")
             return False
+        finally:
+            # 客户端仅用于本次 pong 检查，立即释放其连接池
+            await client.close()
 
         if not cookie_present:
             return False
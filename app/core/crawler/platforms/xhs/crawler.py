@@ -5,10 +5,12 @@ from __future__ import annotations
 
 import asyncio
 import os
+import re
 from asyncio import Semaphore
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, Dict, Iterable, List, Optional, Union
+from urllib.parse import parse_qs, urlparse
 
 from playwright.async_api import BrowserContext, BrowserType, Page, async_playwright
 from playwright._impl._errors import TargetClosedError
@@ -28,14 +30,14 @@ from .publish import XhsPublisher
 logger = get_logger()
 browser_manager = get_browser_manager()
 
+_NOTE_ID_RE = re.compile(r'/explore/([a-f0-9]+)')
+_USER_ID_RE = re.compile(r'/user/profile/([a-f0-9]+)')
+
 
 def _parse_note_url(url: str) -> SimpleNamespace:
     """简单解析小红书笔记URL，提取note_id等信息"""
-    import re
-    from urllib.parse import urlparse, parse_qs
-
     # 提取note_id
-    note_id_match = re.search(r'/explore/([a-f0-9]+)', url)
+    note_id_match = _NOTE_ID_RE.search(url)
     note_id = note_id_match.group(1) if note_id_match else ""
 
     # 解析查询参数
@@ -54,9 +56,6 @@ def _parse_note_url(url: str) -> SimpleNamespace:
 
 def _parse_creator_url(url: str) -> SimpleNamespace:
     """简单解析小红书用户URL，提取user_id等信息"""
-    import re
-    from urllib.parse import urlparse, parse_qs
-
     # 如果是纯ID字符串，直接返回
     if not url.startswith('http'):
         return SimpleNamespace(
@@ -66,7 +65,7 @@ def _parse_creator_url(url: str) -> SimpleNamespace:
         )
 
     # 提取user_id
-    user_id_match = re.search(r'/user/profile/([a-f0-9]+)', url)
+    user_id_match = _USER_ID_RE.search(url)
     user_id = user_id_match.group(1) if user_id_match else ""
 
     # 解析查询参数
@@ -13,7 +13,7 @@
 # @Time    : 2024/1/14 19:34
 # @Desc    :
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 from app.config.settings import global_settings
 from app.providers.logger import get_logger
@@ -23,6 +23,8 @@ from app.core.crawler.platforms.base import AbstractStore
 from ._store_impl import *
 from .bilibilli_store_media import *
 
+logger = get_logger()
+
 
 class BiliStoreFactory:
     """
@@ -39,6 +41,8 @@ class BiliStoreFactory:
         "json": BiliJsonStoreImplement,
         "sqlite": BiliSqliteStoreImplement,
     }
+    # 按 (存储方式, crawler_type) 复用存储实例，共享文件写锁，避免每条数据重新构造
+    _instances: Dict[Tuple[str, str], AbstractStore] = {}
 
     @staticmethod
     def create_store(crawler_type: str = "general") -> AbstractStore:
@@ -46,10 +50,15 @@ class BiliStoreFactory:
         save_option = (global_settings.store.save_format.value
                        if hasattr(global_settings.store.save_format, 'value')
                        else str(global_settings.store.save_format))
-        store_class = BiliStoreFactory.STORES.get(save_option)
-        if not store_class:
-            raise ValueError(f"[BiliStoreFactory.create_store] Invalid save option '{save_option}'. Only supported: csv, db, json, sqlite")
-        return store_class(crawler_type=crawler_type)
+        cache_key = (save_option, crawler_type)
+        store = BiliStoreFactory._instances.get(cache_key)
+        if store is None:
+            store_class = BiliStoreFactory.STORES.get(save_option)
+            if not store_class:
+                raise ValueError(f"[BiliStoreFactory.create_store] Invalid save option '{save_option}'. Only supported: csv, db, json, sqlite")
+            store = store_class(crawler_type=crawler_type)
+            BiliStoreFactory._instances[cache_key] = store
+        return store
 
 
 async def update_bilibili_video(
@@ -84,7 +93,7 @@ async def update_bilibili_video(
         "video_cover_url": video_item_view.get("pic", ""),
         "source_keyword": source_keyword or "",
     }
-    get_logger().info(f"[store.bilibili.update_bilibili_video] bilibili video id:{video_id}, title:{save_content_item.get('title')}")
+    logger.debug("[store.bilibili.update_bilibili_video] bilibili video id:{}, title:{}", video_id, save_content_item.get('title'))
     await BiliStoreFactory.create_store(crawler_type=crawler_type).store_content(content_item=save_content_item)
 
 
@@ -103,7 +112,7 @@ async def update_up_info(video_item: Dict, *, crawler_type: str = "general"):
         "user_rank": video_item_card.get("level_info").get("current_level"),
         "is_official": video_item_card.get("official_verify").get("type"),
     }
-    get_logger().info(f"[store.bilibili.update_up_info] bilibili user_id:{video_item_card.get('mid')}")
+    logger.debug("[store.bilibili.update_up_info] bilibili user_id:{}", video_item_card.get('mid'))
     await BiliStoreFactory.create_store(crawler_type=crawler_type).store_creator(creator=saver_up_info)
 
 
@@ -116,13 +125,9 @@ async def batch_update_bilibili_video_comments(
 ):
     if not comments:
         return
-    for comment_item in comments:
-        await update_bilibili_video_comment(
-            video_id,
-            comment_item,
-            crawler_type=crawler_type,
-            source_keyword=source_keyword,
-        )
+    save_comment_items = [_build_comment_item(video_id, comment_item) for comment_item in comments]
+    logger.info("[store.bilibili.batch_update_bilibili_video_comments] Bilibili video: {}, comments: {}", video_id, len(save_comment_items))
+    await BiliStoreFactory.create_store(crawler_type=crawler_type).store_comments(comment_items=save_comment_items)
 
 
 async def update_bilibili_video_comment(
@@ -132,6 +137,12 @@ async def update_bilibili_video_comment(
     crawler_type: str = "general",
     source_keyword: Optional[str] = None,
 ):
+    save_comment_item = _build_comment_item(video_id, comment_item)
+    logger.debug("[store.bilibili.update_bilibili_video_comment] Bilibili video comment: {}, content: {}", save_comment_item['comment_id'], save_comment_item.get('content'))
+    await BiliStoreFactory.create_store(crawler_type=crawler_type).store_comment(comment_item=save_comment_item)
+
+
+def _build_comment_item(video_id: str, comment_item: Dict) -> Dict:
     comment_id = str(comment_item.get("rpid"))
     parent_comment_id = str(comment_item.get("parent", 0))
     content: Dict = comment_item.get("content")
@@ -152,8 +163,7 @@ async def update_bilibili_video_comment(
         "like_count": like_count,
         "last_modify_ts": get_current_timestamp(),
     }
-    get_logger().info(f"[store.bilibili.update_bilibili_video_comment] Bilibili video comment: {comment_id}, content: {save_comment_item.get('content')}")
-    await BiliStoreFactory.create_store(crawler_type=crawler_type).store_comment(comment_item=save_comment_item)
+    return save_comment_item
 
 
 async def store_video(aid, video_content, extension_file_name):
@@ -179,6 +189,7 @@ async def batch_update_bilibili_creator_fans(
 ):
     if not fans_list:
         return
+    save_contact_items = []
     for fan_item in fans_list:
         fan_info: Dict = {
             "id": fan_item.get("mid"),
@@ -186,11 +197,8 @@ async def batch_update_bilibili_creator_fans(
             "sign": fan_item.get("sign"),
             "avatar": fan_item.get("face"),
         }
-        await update_bilibili_creator_contact(
-            creator_info=creator_info,
-            fan_info=fan_info,
-            crawler_type=crawler_type,
-        )
+        save_contact_items.append(_build_contact_item(creator_info, fan_info))
+    await BiliStoreFactory.create_store(crawler_type=crawler_type).store_contacts(contact_items=save_contact_items)
 
 
 async def batch_update_bilibili_creator_followings(
@@ -201,6 +209,7 @@ async def batch_update_bilibili_creator_followings(
 ):
     if not followings_list:
         return
+    save_contact_items = []
     for following_item in followings_list:
         following_info: Dict = {
             "id": following_item.get("mid"),
@@ -208,11 +217,8 @@ async def batch_update_bilibili_creator_followings(
             "sign": following_item.get("sign"),
             "avatar": following_item.get("face"),
         }
-        await update_bilibili_creator_contact(
-            creator_info=following_info,
-            fan_info=creator_info,
-            crawler_type=crawler_type,
-        )
+        save_contact_items.append(_build_contact_item(following_info, creator_info))
+    await BiliStoreFactory.create_store(crawler_type=crawler_type).store_contacts(contact_items=save_contact_items)
 
 
 async def batch_update_bilibili_creator_dynamics(
@@ -223,6 +229,7 @@ async def batch_update_bilibili_creator_dynamics(
 ):
     if not dynamics_list:
         return
+    save_dynamic_items = []
     for dynamic_item in dynamics_list:
         dynamic_id: str = dynamic_item["id_str"]
         dynamic_text: str = ""
@@ -243,11 +250,8 @@ async def batch_update_bilibili_creator_dynamics(
             "total_forwards": dynamic_forward,
             "total_liked": dynamic_like,
         }
-        await update_bilibili_creator_dynamic(
-            creator_info=creator_info,
-            dynamic_info=dynamic_info,
-            crawler_type=crawler_type,
-        )
+        save_dynamic_items.append(_build_dynamic_item(creator_info, dynamic_info))
+    await BiliStoreFactory.create_store(crawler_type=crawler_type).store_dynamics(dynamic_items=save_dynamic_items)
 
 
 async def update_bilibili_creator_contact(
@@ -256,6 +260,11 @@ async def update_bilibili_creator_contact(
     *,
     crawler_type: str = "general",
 ):
+    save_contact_item = _build_contact_item(creator_info, fan_info)
+    await BiliStoreFactory.create_store(crawler_type=crawler_type).store_contact(contact_item=save_contact_item)
+
+
+def _build_contact_item(creator_info: Dict, fan_info: Dict) -> Dict:
     save_contact_item = {
         "up_id": creator_info["id"],
         "fan_id": fan_info["id"],
@@ -267,8 +276,7 @@ async def update_bilibili_creator_contact(
         "fan_avatar": fan_info["avatar"],
         "last_modify_ts": get_current_timestamp(),
     }
-
-    await BiliStoreFactory.create_store(crawler_type=crawler_type).store_contact(contact_item=save_contact_item)
+    return save_contact_item
 
 
 async def update_bilibili_creator_dynamic(
@@ -277,6 +285,11 @@ async def update_bilibili_creator_dynamic(
     *,
     crawler_type: str = "general",
 ):
+    save_dynamic_item = _build_dynamic_item(creator_info, dynamic_info)
+    await BiliStoreFactory.create_store(crawler_type=crawler_type).store_dynamic(dynamic_item=save_dynamic_item)
+
+
+def _build_dynamic_item(creator_info: Dict, dynamic_info: Dict) -> Dict:
     save_dynamic_item = {
         "dynamic_id": dynamic_info["dynamic_id"],
         "user_id": creator_info["id"],
@@ -289,5 +302,4 @@ async def update_bilibili_creator_dynamic(
         "total_liked": dynamic_info["total_liked"],
         "last_modify_ts": get_current_timestamp(),
     }
-
-    await BiliStoreFactory.create_store(crawler_type=crawler_type).store_dynamic(dynamic_item=save_dynamic_item)
+    return save_dynamic_item
@@ -7,9 +7,10 @@ import csv
 import json
 import os
 import pathlib
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import aiofiles
+from tortoise import timezone
 
 from app.providers.models.bilibili import (
     BilibiliVideo,
@@ -58,6 +59,18 @@ class BiliCsvStoreImplement:
             item_type="comments"
         )
 
+    async def store_comments(self, comment_items: List[Dict]):
+        """
+        comments CSV storage implementation
+        Args:
+            comment_items: comment item dict list
+
+        Returns:
+
+        """
+        for comment_item in comment_items:
+            await self.store_comment(comment_item)
+
     async def store_creator(self, creator: Dict):
         """
         creator CSV storage implementation
@@ -86,6 +99,18 @@ class BiliCsvStoreImplement:
             item_type="contacts"
         )
 
+    async def store_contacts(self, contact_items: List[Dict]):
+        """
+        creator contacts CSV storage implementation
+        Args:
+            contact_items: creator's contact item dict list
+
+        Returns:
+
+        """
+        for contact_item in contact_items:
+            await self.store_contact(contact_item)
+
     async def store_dynamic(self, dynamic_item: Dict):
         """
         creator dynamic CSV storage implementation
@@ -100,6 +125,18 @@ class BiliCsvStoreImplement:
             item_type="dynamics"
         )
 
+    async def store_dynamics(self, dynamic_items: List[Dict]):
+        """
+        creator dynamics CSV storage implementation
+        Args:
+            dynamic_items: creator's dynamic item dict list
+
+        Returns:
+
+        """
+        for dynamic_item in dynamic_items:
+            await self.store_dynamic(dynamic_item)
+
 
 class BiliDbStoreImplement:
     """
@@ -139,22 +176,54 @@ class BiliDbStoreImplement:
         Args:
             comment_item: comment item dict
         """
-        comment_id = comment_item.get("comment_id")
-
-        # Try to get existing comment
-        comment = await BilibiliVideoComment.filter(comment_id=comment_id).first()
+        await self.store_comments([comment_item])
 
-        if comment:
-            # Update existing comment
-            for key, value in comment_item.items():
-                setattr(comment, key, value)
-            comment.last_modify_ts = get_current_timestamp()
-            await comment.save()
-        else:
-            # Create new comment
-            comment_item["add_ts"] = get_current_timestamp()
-            comment_item["last_modify_ts"] = get_current_timestamp()
-            await BilibiliVideoComment.create(**comment_item)
+    async def store_comments(self, comment_items: List[Dict]):
+        """
+        Bilibili comments DB bulk storage implementation using Tortoise ORM
+        一次查询已有评论，再分别批量更新/插入，避免逐条 select + save
+        Args:
+            comment_items: comment item dict list
+        """
+        if not comment_items:
+            return
+
+        # comment_id 非唯一约束，同批内重复的评论先合并（后出现的字段覆盖先出现的），
+        # 与逐条 select + save 的结果一致；合并时复制字典，不修改调用方传入的数据
+        merged: Dict[str, Dict] = {}
+        for comment_item in comment_items:
+            comment_id = str(comment_item.get("comment_id"))
+            merged[comment_id] = {**merged.get(comment_id, {}), **comment_item}
+
+        existing = {
+            str(comment.comment_id): comment
+            for comment in await BilibiliVideoComment.filter(comment_id__in=list(merged.keys()))
+        }
+
+        now_ts = get_current_timestamp()
+        now_dt = timezone.now()
+        to_update, to_create = [], []
+        update_fields = {"last_modify_ts", "update_time"}
+        for comment_id, comment_item in merged.items():
+            comment = existing.get(comment_id)
+            if comment:
+                # Update existing comment
+                for key, value in comment_item.items():
+                    setattr(comment, key, value)
+                comment.last_modify_ts = now_ts
+                comment.update_time = now_dt
+                update_fields.update(comment_item.keys())
+                to_update.append(comment)
+            else:
+                # Create new comment
+                comment_item["add_ts"] = now_ts
+                comment_item["last_modify_ts"] = now_ts
+                to_create.append(BilibiliVideoComment(**comment_item))
+
+        if to_update:
+            await BilibiliVideoComment.bulk_update(to_update, fields=list(update_fields))
+        if to_create:
+            await BilibiliVideoComment.bulk_create(to_create)
 
     async def store_creator(self, creator: Dict):
         """
@@ -203,6 +272,15 @@ class BiliDbStoreImplement:
             contact_item["last_modify_ts"] = get_current_timestamp()
             await BilibiliContactInfo.create(**contact_item)
 
+    async def store_contacts(self, contact_items: List[Dict]):
+        """
+        Bilibili contacts DB storage implementation using Tortoise ORM
+        Args:
+            contact_items: contact item dict list
+        """
+        for contact_item in contact_items:
+            await self.store_contact(contact_item)
+
     async def store_dynamic(self, dynamic_item: Dict):
         """
         Bilibili dynamic DB storage implementation using Tortoise ORM
@@ -226,6 +304,15 @@ class BiliDbStoreImplement:
             dynamic_item["last_modify_ts"] = get_current_timestamp()
             await BilibiliUpDynamic.create(**dynamic_item)
 
+    async def store_dynamics(self, dynamic_items: List[Dict]):
+        """
+        Bilibili dynamics DB storage implementation using Tortoise ORM
+        Args:
+            dynamic_items: dynamic item dict list
+        """
+        for dynamic_item in dynamic_items:
+            await self.store_dynamic(dynamic_item)
+
 
 class BiliJsonStoreImplement:
     def __init__(self, crawler_type: str = "general"):
@@ -262,6 +349,20 @@ class BiliJsonStoreImplement:
             item_type="comments"
         )
 
+    async def store_comments(self, comment_items: List[Dict]):
+        """
+        comments JSON storage implementation, one read/write for the whole batch
+        Args:
+            comment_items: comment item dict list
+
+        Returns:
+
+        """
+        await self.file_writer.write_items_to_json(
+            items=comment_items,
+            item_type="comments"
+        )
+
     async def store_creator(self, creator: Dict):
         """
         creator JSON storage implementation
@@ -290,6 +391,20 @@ class BiliJsonStoreImplement:
             item_type="contacts"
         )
 
+    async def store_contacts(self, contact_items: List[Dict]):
+        """
+        creator contacts JSON storage implementation, one read/write for the whole batch
+        Args:
+            contact_items: creator's contact item dict list
+
+        Returns:
+
+        """
+        await self.file_writer.write_items_to_json(
+            items=contact_items,
+            item_type="contacts"
+        )
+
     async def store_dynamic(self, dynamic_item: Dict):
         """
         creator dynamic JSON storage implementation
@@ -304,6 +419,20 @@ class BiliJsonStoreImplement:
             item_type="dynamics"
         )
 
+    async def store_dynamics(self, dynamic_items: List[Dict]):
+        """
+        creator dynamics JSON storage implementation, one read/write for the whole batch
+        Args:
+            dynamic_items: creator's dynamic item dict list
+
+        Returns:
+
+        """
+        await self.file_writer.write_items_to_json(
+            items=dynamic_items,
+            item_type="dynamics"
+        )
+
 
 class BiliSqliteStoreImplement(BiliDbStoreImplement):
     def __init__(self, *args, **kwargs):
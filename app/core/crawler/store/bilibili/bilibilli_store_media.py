@@ -4,6 +4,8 @@ from typing import Dict
 import aiofiles
 from app.providers.logger import get_logger
 
+logger = get_logger()
+
 
 class BilibiliVideo:
     # 统一使用平台代号目录，避免与 'bili' 重复
@@ -50,4 +52,4 @@ class BilibiliVideo:
         save_file_name = self.make_save_file_name(str(aid), extension_file_name)
         async with aiofiles.open(save_file_name, 'wb') as f:
             await f.write(video_content)
-            get_logger().info(f"[BilibiliVideoImplement.save_video] save save_video {save_file_name} success ...")
+            logger.debug("[BilibiliVideoImplement.save_video] save save_video {} success ...", save_file_name)
@@ -4,12 +4,12 @@
 from __future__ import annotations
 
 import json
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import httpx
 
 from app.config.settings import global_settings
-from app.core.crawler.tools import time_util
+from app.core.crawler.tools import crawler_util, time_util
 from app.providers.logger import get_logger
 
 from .store_impl import (
@@ -22,6 +22,9 @@ from .xhs_store_media import XiaoHongShuImage, XiaoHongShuVideo
 
 logger = get_logger()
 
+# 媒体下载建连失败时的传输层重试次数
+_MEDIA_CONNECT_RETRIES = 2
+
 
 class XhsStoreFactory:
     STORES = {
@@ -30,15 +33,23 @@ class XhsStoreFactory:
         "db": XhsDbStoreImplement,
         "sqlite": XhsSqliteStoreImplement,
     }
+    _instances: Dict[Tuple[str, str], object] = {}
 
     @classmethod
     def create_store(cls, *, crawler_type: str = "general"):
         save_format = str(getattr(global_settings.store.save_format, "value", global_settings.store.save_format))
+        cache_key = (save_format, crawler_type)
+        store = cls._instances.get(cache_key)
+        if store is not None:
+            return store
+
         store_cls = cls.STORES.get(save_format, XhsJsonStoreImplement)
         if store_cls in (XhsDbStoreImplement, XhsSqliteStoreImplement):
-            logger.warning("[xhs.store] %s 未实现，fallback 到 JSON", save_format)
+            logger.warning("[xhs.store] {} 未实现，fallback 到 JSON", save_format)
             store_cls = XhsJsonStoreImplement
-        return store_cls(crawler_type=crawler_type)
+        store = store_cls(crawler_type=crawler_type)
+        cls._instances[cache_key] = store
+        return store
 
 
 async def update_xhs_note(note_item: Dict) -> None:
@@ -89,11 +100,16 @@ async def batch_update_xhs_note_comments(note_id: str, comments: List[Dict]) ->
     if not comments:
         return
     store = XhsStoreFactory.create_store()
-    for comment in comments:
-        await update_xhs_note_comment(store, note_id, comment)
+    records = [_build_comment_record(note_id, comment) for comment in comments]
+    # 整批一次写入，避免 JSON 文件按条反复读取与重写
+    await store.store_comments(records)
 
 
 async def update_xhs_note_comment(store, note_id: str, comment_item: Dict) -> None:
+    await store.store_comment(_build_comment_record(note_id, comment_item))
+
+
+def _build_comment_record(note_id: str, comment_item: Dict) -> Dict:
     user_info = comment_item.get("user_info", {})
     target_comment = comment_item.get("target_comment", {})
     pictures = [pic.get("url_default", "") for pic in comment_item.get("pictures", [])]
@@ -113,7 +129,7 @@ async def update_xhs_note_comment(store, note_id: str, comment_item: Dict) -> No
         "last_modify_ts": time_util.get_current_timestamp(),
         "like_count": comment_item.get("like_count", 0),
     }
-    await store.store_comment(record)
+    return record
 
 
 async def save_creator(user_id: str, creator: Dict) -> None:
@@ -144,37 +160,44 @@ async def save_creator(user_id: str, creator: Dict) -> None:
 
 async def get_note_images(note_item: Dict) -> None:
     image_list = note_item.get("image_list") or []
+    if not image_list:
+        return
     image_store = XiaoHongShuImage()
-    for index, pic in enumerate(image_list):
-        url = pic.get("url") or pic.get("url_size_large")
-        if not url:
-            continue
-        content = await _download_binary(url)
-        if content is None:
-            continue
-        await image_store.store_image(
-            {
-                "notice_id": note_item.get("note_id"),
-                "pic_content": content,
-                "extension_file_name": f"{index}.jpg",
-            }
-        )
+    # 同一笔记的图片复用一个连接池
+    async with _new_media_client() as client:
+        for index, pic in enumerate(image_list):
+            url = pic.get("url") or pic.get("url_size_large")
+            if not url:
+                continue
+            content = await _download_binary(client, url)
+            if content is None:
+                continue
+            await image_store.store_image(
+                {
+                    "notice_id": note_item.get("note_id"),
+                    "pic_content": content,
+                    "extension_file_name": f"{index}.jpg",
+                }
+            )
 
 
 async def get_note_videos(note_item: Dict) -> None:
     videos = get_video_url_list(note_item)
+    if not videos:
+        return
     video_store = XiaoHongShuVideo()
-    for index, url in enumerate(videos):
-        content = await _download_binary(url)
-        if content is None:
-            continue
-        await video_store.store_video(
-            {
-                "notice_id": note_item.get("note_id"),
-                "video_content": content,
-                "extension_file_name": f"{index}.mp4",
-            }
-        )
+    async with _new_media_client() as client:
+        for index, url in enumerate(videos):
+            content = await _download_binary(client, url)
+            if content is None:
+                continue
+            await video_store.store_video(
+                {
+                    "notice_id": note_item.get("note_id"),
+                    "video_content": content,
+                    "extension_file_name": f"{index}.mp4",
+                }
+            )
 
 
 def get_video_url_list(note_item: Dict) -> List[str]:
@@ -190,12 +213,15 @@ def get_video_url_list(note_item: Dict) -> List[str]:
     return []
 
 
-async def _download_binary(url: str) -> Optional[bytes]:
+def _new_media_client() -> httpx.AsyncClient:
+    return crawler_util.new_async_client(retries=_MEDIA_CONNECT_RETRIES)
+
+
+async def _download_binary(client: httpx.AsyncClient, url: str) -> Optional[bytes]:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, timeout=30)
-            if response.status_code == 200:
-                return response.content
+        response = await client.get(url, timeout=30)
+        if response.status_code == 200:
+            return response.content
     except Exception as exc:  # pragma: no cover - defensive
-        logger.debug("[xhs.store] download media failed url=%s err=%s", url, exc)
+        logger.debug("[xhs.store] download media failed url={} err={}", url, exc)
     return None
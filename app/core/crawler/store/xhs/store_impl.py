@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, List
 
 from app.config.settings import Platform
 from app.core.crawler.tools.async_file_writer import AsyncFileWriter
@@ -24,6 +24,9 @@ class XhsJsonStoreImplement(_BaseFileStore):
     async def store_comment(self, comment_item: Dict) -> None:
         await self.file_writer.write_single_item_to_json(comment_item, item_type="comments")
 
+    async def store_comments(self, comment_items: List[Dict]) -> None:
+        await self.file_writer.write_items_to_json(comment_items, item_type="comments")
+
     async def store_creator(self, creator: Dict) -> None:
         await self.file_writer.write_single_item_to_json(creator, item_type="creators")
 
@@ -35,6 +38,10 @@ class XhsCsvStoreImplement(_BaseFileStore):
     async def store_comment(self, comment_item: Dict) -> None:
         await self.file_writer.write_to_csv(comment_item, item_type="comments")
 
+    async def store_comments(self, comment_items: List[Dict]) -> None:
+        for comment_item in comment_items:
+            await self.store_comment(comment_item)
+
     async def store_creator(self, creator: Dict) -> None:
         await self.file_writer.write_to_csv(creator, item_type="creators")
 
@@ -51,6 +58,9 @@ class XhsDbStoreImplement:
     async def store_comment(self, comment_item: Dict) -> None:  # pragma: no cover - defensive
         raise NotImplementedError
 
+    async def store_comments(self, comment_items: List[Dict]) -> None:  # pragma: no cover - defensive
+        raise NotImplementedError
+
     async def store_creator(self, creator: Dict) -> None:  # pragma: no cover - defensive
         raise NotImplementedError
 
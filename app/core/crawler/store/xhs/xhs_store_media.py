@@ -27,7 +27,7 @@ class XiaoHongShuImage:
         path.mkdir(parents=True, exist_ok=True)
         async with aiofiles.open(path / file_name, "wb") as fp:
             await fp.write(content)
-        logger.info("[xhs.media] save image note_id=%s file=%s", note_id, file_name)
+        logger.debug("[xhs.media] save image note_id={} file={}", note_id, file_name)
 
 
 class XiaoHongShuVideo:
@@ -44,7 +44,7 @@ class XiaoHongShuVideo:
         path.mkdir(parents=True, exist_ok=True)
         async with aiofiles.open(path / file_name, "wb") as fp:
             await fp.write(content)
-        logger.info("[xhs.media] save video note_id=%s file=%s", note_id, file_name)
+        logger.debug("[xhs.media] save video note_id={} file={}", note_id, file_name)
 
 
 __all__ = ["XiaoHongShuImage", "XiaoHongShuVideo"]
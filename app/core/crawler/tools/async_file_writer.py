@@ -1,10 +1,11 @@
 import asyncio
 import csv
-import json
 import os
 import pathlib
-from typing import Dict
+from contextlib import asynccontextmanager
+from typing import Dict, List, Set
 import aiofiles
+import ujson
 from app.core.crawler.tools.time_util import get_current_date
 
 class AsyncFileWriter:
@@ -12,24 +13,49 @@ class AsyncFileWriter:
         self.lock = asyncio.Lock()
         self.platform = platform
         self.crawler_type = crawler_type
+        # 已创建过的目录，避免每次写入都 mkdir
+        self._created_dirs: Set[str] = set()
 
     def _get_file_path(self, file_type: str, item_type: str) -> str:
         base_path = f"data/{self.platform}/{file_type}"
-        pathlib.Path(base_path).mkdir(parents=True, exist_ok=True)
+        if base_path not in self._created_dirs:
+            self._ensure_dir(base_path)
         file_name = f"{self.crawler_type}_{item_type}_{get_current_date()}.{file_type}"
         return f"{base_path}/{file_name}"
 
+    def _ensure_dir(self, base_path: str):
+        pathlib.Path(base_path).mkdir(parents=True, exist_ok=True)
+        self._created_dirs.add(base_path)
+
+    @asynccontextmanager
+    async def _open_for_write(self, file_path: str, mode: str, **kwargs):
+        try:
+            f = await aiofiles.open(file_path, mode, **kwargs)
+        except FileNotFoundError:
+            # 目录在运行期间被删除，重建后重试一次
+            self._ensure_dir(os.path.dirname(file_path))
+            f = await aiofiles.open(file_path, mode, **kwargs)
+        try:
+            yield f
+        finally:
+            await f.close()
+
     async def write_to_csv(self, item: Dict, item_type: str):
         file_path = self._get_file_path('csv', item_type)
         async with self.lock:
-            file_exists = os.path.exists(file_path)
-            async with aiofiles.open(file_path, 'a', newline='', encoding='utf-8-sig') as f:
+            async with self._open_for_write(file_path, 'a', newline='', encoding='utf-8-sig') as f:
                 writer = csv.DictWriter(f, fieldnames=item.keys())
-                if not file_exists or await f.tell() == 0:
+                # 追加模式下新文件的位置为 0，无需再单独 stat 判断是否存在
+                if await f.tell() == 0:
                     await writer.writeheader()
                 await writer.writerow(item)
 
     async def write_single_item_to_json(self, item: Dict, item_type: str):
+        await self.write_items_to_json([item], item_type)
+
+    async def write_items_to_json(self, items: List[Dict], item_type: str):
+        if not items:
+            return
         file_path = self._get_file_path('json', item_type)
         async with self.lock:
             existing_data = []
@@ -38,13 +64,13 @@ class AsyncFileWriter:
                     try:
                         content = await f.read()
                         if content:
-                            existing_data = json.loads(content)
+                            existing_data = ujson.loads(content)
                         if not isinstance(existing_data, list):
                             existing_data = [existing_data]
-                    except json.JSONDecodeError:
+                    except ValueError:
                         existing_data = []
             
-            existing_data.append(item)
+            existing_data.extend(items)
 
-            async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(existing_data, ensure_ascii=False, indent=4))
+            async with self._open_for_write(file_path, 'w', encoding='utf-8') as f:
+                await f.write(ujson.dumps(existing_data, ensure_ascii=False, indent=4, escape_forward_slashes=False))
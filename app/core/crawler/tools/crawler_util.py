@@ -19,6 +19,7 @@ import random
 import re
 import urllib
 import urllib.parse
+import urllib.request
 from io import BytesIO
 from typing import Dict, List, Optional, Tuple, cast
 
@@ -30,6 +31,10 @@ from app.providers.logger import get_logger
 
 logger = get_logger()
 
+_DIGITS_RE = re.compile(r'\d+')
+_SCRIPT_STYLE_RE = re.compile(r'<(script|style)[^>]*>.*?</\1>', re.DOTALL)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
 
 async def find_login_qrcode(page: Page, selector: str) -> str:
     """find login qrcode image from target selector"""
@@ -108,6 +113,64 @@ def show_qrcode(qr_code) -> None:  # type: ignore
     new_image.show()
 
 
+_proxy_retry_warned = False
+
+
+def _warn_proxy_retries_disabled(retries: int):
+    """
+    httpcore 经代理建连时不做重试（AsyncHTTPTransport 不会把 retries 传给代理连接池），只提示一次
+    """
+    global _proxy_retry_warned
+    if retries and not _proxy_retry_warned:
+        _proxy_retry_warned = True
+        logger.warning(f"[new_async_client] connect retries ({retries}) are not applied to requests sent through a proxy")
+
+
+def _env_proxy_mounts(retries: int) -> Dict[str, httpx.AsyncHTTPTransport]:
+    """
+    按 httpx 的环境变量代理规则，把 HTTP(S)_PROXY/ALL_PROXY/NO_PROXY 转成 mounts
+    """
+    proxies = urllib.request.getproxies()
+    no_proxy = proxies.pop("no", "")
+    if no_proxy.strip() == "*":
+        return {}
+
+    mounts: Dict[str, httpx.AsyncHTTPTransport] = {}
+    for scheme in ("http", "https", "all"):
+        url = proxies.get(scheme)
+        if url:
+            url = url if "://" in url else f"http://{url}"
+            mounts[f"{scheme}://"] = httpx.AsyncHTTPTransport(proxy=url, retries=retries)
+            _warn_proxy_retries_disabled(retries)
+
+    # NO_PROXY 中的主机直连，同样保留重试
+    for host in no_proxy.split(","):
+        host = host.strip()
+        if not host:
+            continue
+        if "://" in host:
+            pattern = host
+        elif ":" in host and not host.startswith("["):
+            pattern = f"all://[{host}]"
+        else:
+            pattern = f"all://*{host}"
+        mounts[pattern] = httpx.AsyncHTTPTransport(retries=retries)
+    return mounts
+
+
+def new_async_client(proxy: Optional[str] = None, retries: int = 0, **kwargs) -> httpx.AsyncClient:
+    """
+    创建带建连重试的 httpx.AsyncClient
+    传入 transport 会关闭 httpx 的环境变量代理发现，因此未显式指定代理时
+    自行读取环境代理并挂载为 mounts，直连主机（含 NO_PROXY）始终带重试
+    """
+    transport = httpx.AsyncHTTPTransport(proxy=proxy, retries=retries)
+    if proxy:
+        _warn_proxy_retries_disabled(retries)
+        return httpx.AsyncClient(transport=transport, **kwargs)
+    return httpx.AsyncClient(transport=transport, mounts=_env_proxy_mounts(retries), **kwargs)
+
+
 def get_user_agent() -> str:
     ua_list = [
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36",
@@ -180,7 +243,7 @@ def match_interact_info_count(count_str: str) -> int:
     if not count_str:
         return 0
 
-    match = re.search(r'\d+', count_str)
+    match = _DIGITS_RE.search(count_str)
     if match:
         number = match.group()
         return int(number)
@@ -213,9 +276,9 @@ def extract_text_from_html(html: str) -> str:
         return ""
 
     # Remove script and style elements
-    clean_html = re.sub(r'<(script|style)[^>]*>.*?</\1>', '', html, flags=re.DOTALL)
+    clean_html = _SCRIPT_STYLE_RE.sub('', html)
     # Remove all other tags
-    clean_text = re.sub(r'<[^>]+>', '', clean_html).strip()
+    clean_text = _HTML_TAG_RE.sub('', clean_html).strip()
     return clean_text
 
 def extract_url_params_to_dict(url: str) -> Dict:
@@ -167,6 +167,9 @@ class BilibiliLogin(AbstractLogin):
                 return via_page or cookie_present
             logger.debug(f"[BilibiliLogin.has_valid_cookie] Pong failed: {exc}")
             return False
+        finally:
+            # 客户端仅用于本次 pong 检查，立即释放其连接池
+            await client.close()
 
         if not cookie_present:
             return False
@@ -327,6 +330,7 @@ class BilibiliLogin(AbstractLogin):
         has_key_cookies = bool(cookie_dict.get("SESSDATA") and cookie_dict.get("DedeUserID"))
 
         page_for_client = None
+        bili_client: Optional[BilibiliClient] = None
         try:
             # 先尝试API验证（提供 Page，以便在被风控时可回退到浏览器 fetch）
             try:
@@ -415,6 +419,8 @@ class BilibiliLogin(AbstractLogin):
                     except Exception:
                         pass
         finally:
+            if bili_client:
+                await bili_client.close()
             # 关闭为 client 创建的临时页面（无论成功或失败）
             if page_for_client:
                 try:
@@ -433,11 +439,12 @@ async def start_login(service, session: LoginSession, payload: LoginStartPayload
 
     # 清理旧二维码目录
     qr_dir = get_user_data_dir().parent / f"{Platform.BILIBILI.value}_{payload.login_type}"
-    if qr_dir.exists():
-        try:
-            shutil.rmtree(qr_dir)
-        except Exception as exc:
-            logger.warning(f"[登录管理] 清理旧二维码目录失败: {exc}")
+    try:
+        await asyncio.to_thread(shutil.rmtree, qr_dir)
+    except FileNotFoundError:
+        pass
+    except Exception as exc:
+        logger.warning(f"[登录管理] 清理旧二维码目录失败: {exc}")
 
     # 检查现有登录状态（仅在非Cookie登录且非二维码登录时）
     cookie_candidate = (payload.cookie or "").strip()
@@ -840,10 +847,7 @@ async def logout(service) -> None:
     qr_parent = Path("browser_data")
     if qr_parent.exists():
         for qr_dir in qr_parent.glob(f"{Platform.BILIBILI.value}_*"):
-            try:
-                await asyncio.to_thread(shutil.rmtree, qr_dir)
-            except Exception:
-                pass
+            await asyncio.to_thread(shutil.rmtree, qr_dir, ignore_errors=True)
 
 
 def get_user_data_dir() -> Path:
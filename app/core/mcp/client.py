@@ -8,15 +8,8 @@ from app.config.settings import global_settings
 logger = get_logger()
 
 class MCPClientManager:
-    """MCP Client 管理器 - 用于调用 MCP 工具"""
-    
-    _instance = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-    
+    """MCP Client 管理器 - 用于调用 MCP 工具（通过模块级 mcp_client_manager 共享）"""
+
     async def call_tool(self, tool_name: str, arguments: dict):
         """通过 MCP Client 调用工具"""
         try:
@@ -4,12 +4,13 @@ Redis队列管理器 - 基于Redis的持久化发布队列
 """
 
 import asyncio
+import heapq
 import time
 import uuid
 import ujson
 from enum import Enum
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any, Callable, Awaitable
+from typing import Dict, List, Optional, Any, Callable, Awaitable, Set, Tuple
 
 import redis.asyncio as aioredis
 from pydantic import BaseModel, Field
@@ -108,6 +109,8 @@ class RedisQueuerManager:
                 db=global_settings.redis.db + 1,  # 使用不同的db避免冲突
                 decode_responses=True,
                 max_connections=100,
+                socket_keepalive=True,  # TCP keepalive，避免空闲连接被中间设备静默断开
+                health_check_interval=30,  # 空闲超过 30 秒的连接使用前先 PING 校验
             )
             redis_client = aioredis.Redis(connection_pool=pool)
             cls._instances[platform] = redis_client
@@ -223,20 +226,28 @@ class PlatformQueuer:
     
     async def get_stats(self) -> Dict[str, Any]:
         """获取队列统计"""
-        queue_size = await self.redis.zcard(self.queue_key)
-        processing_count = await self.redis.scard(self.processing_key)
-        pending_count = await self.redis.zcard(self.pending_key)
-        
-        # 发布历史统计
         now = time.time()
         hour_ago = now - 3600
         day_ago = now - 86400
         
-        hourly_count = await self.redis.zcount(self.history_key, hour_ago, now)
-        daily_count = await self.redis.zcount(self.history_key, day_ago, now)
-        
-        # 最后发布时间
-        last_publish = await self.redis.get(f"{self.stats_key}:last_publish")
+        # 各项统计合并为一次 pipeline 往返
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.zcard(self.queue_key)
+            pipe.scard(self.processing_key)
+            pipe.zcard(self.pending_key)
+            # 发布历史统计
+            pipe.zcount(self.history_key, hour_ago, now)
+            pipe.zcount(self.history_key, day_ago, now)
+            # 最后发布时间
+            pipe.get(f"{self.stats_key}:last_publish")
+            (
+                queue_size,
+                processing_count,
+                pending_count,
+                hourly_count,
+                daily_count,
+                last_publish,
+            ) = await pipe.execute()
         last_publish_time = float(last_publish) if last_publish else 0
         
         return {
@@ -418,15 +429,31 @@ class PlatformQueuer:
 
     async def list_tasks(self, limit: int = 50) -> List[PublishTask]:
         """列出平台所有任务（按创建时间倒序，限制数量）"""
-        all_map = await self.redis.hgetall(self.tasks_key)
-        items: List[PublishTask] = []
-        for _, raw in all_map.items():
+        if limit <= 0:
+            return []
+        # HSCAN 分批读取，小顶堆只保留最新的 limit 条，避免一次性加载整个任务哈希
+        # 以 (created_at, field) 排序，字段唯一，比较不会落到 task 上
+        newest: List[Tuple[float, str, PublishTask]] = []
+        # HSCAN 只保证每个字段至少返回一次，仅记录当前在堆中的字段（最多 limit 个）；
+        # 已被挤出的字段再次返回时键不大于堆顶，heappushpop 会直接将其弹回
+        in_heap: Set[str] = set()
+        async for field, raw in self.redis.hscan_iter(self.tasks_key, count=500):
+            if field in in_heap:
+                continue
             try:
-                items.append(PublishTask.model_validate(ujson.loads(raw)))
+                task = PublishTask.model_validate(ujson.loads(raw))
             except Exception:
                 continue
-        items.sort(key=lambda x: x.created_at or 0, reverse=True)
-        return items[:limit]
+            entry = (task.created_at or 0, field, task)
+            if len(newest) < limit:
+                heapq.heappush(newest, entry)
+                in_heap.add(field)
+            else:
+                dropped = heapq.heappushpop(newest, entry)
+                if dropped is not entry:
+                    in_heap.discard(dropped[1])
+                    in_heap.add(field)
+        return [task for _, _, task in sorted(newest, reverse=True)]
 
     async def update_pending(self, task_id: str, changes: Dict[str, Any]) -> PublishTask:
         """更新待审核任务的负载或附加字段"""
@@ -482,15 +509,15 @@ class PlatformQueuer:
     
     async def _record_publish(self, timestamp: float) -> None:
         """记录发布时间"""
-        # 更新最后发布时间
-        await self.redis.set(f"{self.stats_key}:last_publish", timestamp)
-        
-        # 添加到发布历史
-        await self.redis.zadd(self.history_key, {str(uuid.uuid4()): timestamp})
-        
-        # 清理1天前的记录
         day_ago = timestamp - 86400
-        await self.redis.zremrangebyscore(self.history_key, 0, day_ago)
+        async with self.redis.pipeline() as pipe:
+            # 更新最后发布时间
+            pipe.set(f"{self.stats_key}:last_publish", timestamp)
+            # 添加到发布历史
+            pipe.zadd(self.history_key, {str(uuid.uuid4()): timestamp})
+            # 清理1天前的记录
+            pipe.zremrangebyscore(self.history_key, 0, day_ago)
+            await pipe.execute()
     
     async def _can_publish_now(self) -> bool:
         """检查发布间隔"""
@@ -526,10 +553,9 @@ class PlatformQueuer:
         if processing_tasks:
             logger.info(f"[Queuer] {self.platform} 恢复 {len(processing_tasks)} 个处理中的任务")
             
-            # 重新入队
-            for task_id in processing_tasks:
-                score = int(time.time())
-                await self.redis.zadd(self.queue_key, {task_id: score})
+            # 单次 ZADD 批量重新入队
+            score = int(time.time())
+            await self.redis.zadd(self.queue_key, {task_id: score for task_id in processing_tasks})
             
             # 清空处理中集合
             await self.redis.delete(self.processing_key)
@@ -697,12 +723,13 @@ class PublishQueue:
         if task.status not in [TaskStatus.SUCCESS.value, TaskStatus.FAILED.value]:
             raise ValueError(f"只能删除已完成或失败的任务，当前状态: {task.status}")
 
-        # 从Redis中删除任务数据
-        await queuer.redis.hdel(queuer.tasks_key, task_id)
-
-        # 确保从所有集合中移除
-        await queuer.redis.zrem(queuer.queue_key, task_id)
-        await queuer.redis.zrem(queuer.pending_key, task_id)
-        await queuer.redis.srem(queuer.processing_key, task_id)
+        async with queuer.redis.pipeline() as pipe:
+            # 从Redis中删除任务数据
+            pipe.hdel(queuer.tasks_key, task_id)
+            # 确保从所有集合中移除
+            pipe.zrem(queuer.queue_key, task_id)
+            pipe.zrem(queuer.pending_key, task_id)
+            pipe.srem(queuer.processing_key, task_id)
+            await pipe.execute()
 
         logger.info(f"[Queuer] {platform} 任务已删除: {task_id}")
@@ -23,6 +23,8 @@ class RedisInstanceManager:
                 db=db,
                 decode_responses=False,  # 不自动解码数据
                 max_connections=max_connections,  # 限制连接数
+                socket_keepalive=True,  # TCP keepalive，避免空闲连接被中间设备静默断开
+                health_check_interval=30,  # 空闲超过 30 秒的连接使用前先 PING 校验
             )
             redis_client = aioredis.Redis(connection_pool=pool)
             cls._instances[db] = redis_client